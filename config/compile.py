@@ -0,0 +1,44 @@
+"""
+compile.py
+----------
+Pre-compiles the merged configuration into a Python module.
+
+Running `python -m config.compile` from the project root parses default.yaml and
+user.yaml, merges them, and writes the result to config/_compiled.py as a plain dict
+literal. config.py imports that module instead of parsing YAML, as long as neither
+YAML file has changed since it was compiled.
+"""
+
+import ast
+from pprint import pformat
+
+from config.config import COMPILED_CONFIG_PATH, parse_config, source_mtimes, write_atomically
+
+
+def compile_config() -> None:
+    """
+    Parses and merges the YAML config files and writes the compiled config module.
+    """
+    
+    # recording the source modification times before parsing, so an edit made while
+    # compiling leaves the compiled module stale rather than silently outdated
+    mtimes = source_mtimes()
+    config_literal = pformat(parse_config(), sort_dicts = False)
+    
+    # making sure the config can round-trip as a literal (e.g. no YAML timestamps)
+    ast.literal_eval(config_literal)
+    
+    source = (
+        '# generated by `python -m config.compile`; do not edit by hand\n'
+        '# (edit default.yaml or user.yaml and recompile instead)\n'
+        '\n'
+        f'SOURCE_MTIMES = {mtimes!r}\n'
+        '\n'
+        f'CONFIG = {config_literal}\n'
+    )
+    write_atomically(COMPILED_CONFIG_PATH, source.encode('utf-8'))
+
+
+if __name__ == '__main__':
+    compile_config()
+    print(f'Compiled config written to {COMPILED_CONFIG_PATH}')
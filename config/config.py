@@ -7,73 +7,301 @@ Responsibilities:
 - Loading default.yaml (always required)
 - Loading user.yaml (optional override)
 - Merging them so user settings override defaults
-- Exposing a single CONFIG dictionary for the rest of the app
+- Caching the merged result on disk so warm starts can skip YAML parsing
+- Preferring a pre-compiled config module (see compile.py) when it is up to date
+- Exposing a single read-only CONFIG mapping for the rest of the app
 
 By doing so, I am keeping configuration logic and magic numbers out of UI code.
 """
 
+import functools
+import os
+import sys
+from collections.abc import Mapping
 from pathlib import Path
-import yaml
+from types import MappingProxyType
 
 # resolving the config directory relative to this file
 CONFIG_DIR = Path(__file__).parent
 DEFAULT_CONFIG_PATH = CONFIG_DIR / 'default.yaml'
 USER_CONFIG_PATH = CONFIG_DIR / 'user.yaml'
+CONFIG_CACHE_PATH = CONFIG_DIR / '.config.cache.pkl'
+COMPILED_CONFIG_PATH = CONFIG_DIR / '_compiled.py'
+
+# version of the on-disk cache contents; bumping this invalidates existing caches
+# whenever the way the merged config is built changes
+CONFIG_CACHE_VERSION = 1
 
 
 def _deep_merge_dicts(base: dict, override: dict) -> dict:
     """
-    Recursively merges two dictionaries.
+    Merges two dictionaries, descending into nested dictionaries.
     - Values from `override` take precedence
     - Nested dictionaries are merged, not replaced
-
-    Returns the resulting merged dictionary.
+    
+    Walks the nested levels with an explicit stack instead of recursing. Only the
+    nested dictionaries the override actually changes are copied, so `base` is never
+    mutated and untouched branches are shared with it.
+    
+    Returns the resulting merged dictionary. If either dictionary is empty, the other
+    is returned as-is (without copying), so callers must not mutate the result.
     """
     
-    # starting from the base
+    # skipping the copy entirely when there is nothing to merge
+    # (the common case when user.yaml is missing or only has comments)
+    if not override:
+        return base
+    if not base:
+        return override
+    
+    # starting from a shallow copy of the base
     result = base.copy()
+    stack = [(result, override)]
     
-    for key, value in override.items():
-        # merging recursively if both values are dictionaries
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
-            result[key] = _deep_merge_dicts(result[key], value)
+    while stack:
+        dst, src = stack.pop()
         
-        # otherwise, overriding the base value completely
-        else:
-            result[key] = value
+        # bulk-copying in one update if the two levels share no keys
+        common = dst.keys() & src.keys()
+        if not common:
+            dst.update(src)
+            continue
+        
+        # adding the keys only present in the override directly
+        dst.update({key: value for key, value in src.items() if key not in common})
+        
+        for key in common:
+            value = src[key]
+            # deferring the merge if both values are dictionaries
+            # (copying the nested base dictionary first, since it is about to change)
+            if isinstance(value, dict) and isinstance(dst[key], dict):
+                dst[key] = dict(dst[key])
+                stack.append((dst[key], value))
+            
+            # otherwise, overriding the base value completely
+            else:
+                dst[key] = value
     
     return result
 
 
-def load_config() -> dict:
+def _freeze(value):
+    """
+    Returns a read-only version of the config value, wrapping dictionaries in
+    MappingProxyType and converting lists to tuples at every level.
+    
+    Every string (including dictionary keys) is also interned, so repeated values
+    such as colors and font names share one object and key lookups can compare by
+    identity. This runs on every load, since unpickled strings are not interned.
+    """
+    
+    if isinstance(value, dict):
+        return MappingProxyType({
+            sys.intern(key) if isinstance(key, str) else key: _freeze(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    
+    return value
+
+
+def source_mtimes() -> tuple:
+    """
+    Returns the modification times of the YAML config files, used as the key for the
+    on-disk config cache. A missing user config is recorded as None.
+    """
+    
+    default_mtime = DEFAULT_CONFIG_PATH.stat().st_mtime_ns
+    try:
+        user_mtime = USER_CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        user_mtime = None
+    
+    return (default_mtime, user_mtime)
+
+
+def _read_config_cache(mtimes: tuple) -> dict | None:
+    """
+    Returns the cached merged config if it was written by the current cache version
+    from YAML files with the given modification times, otherwise None.
+    """
+    
+    # importing pickle only when the cache is actually used
+    import pickle
+    
+    try:
+        with open(CONFIG_CACHE_PATH, 'rb') as f:
+            cached_version, cached_mtimes, cached_config = pickle.load(f)
+    # treating a missing, unreadable, or damaged cache as a cache miss
+    # (the cache is only an optimization, and unpickling a damaged file can raise
+    #  nearly anything, so startup should never fail because of it)
+    except Exception:
+        return None
+    
+    if cached_version != CONFIG_CACHE_VERSION or cached_mtimes != mtimes:
+        return None
+    
+    return cached_config
+
+
+def write_atomically(path: Path, data: bytes) -> None:
+    """
+    Writes the data to a temporary file next to `path` and then moves it into place,
+    so readers never see a partially written file.
+    """
+    
+    import tempfile
+    
+    fd, tmp_path = tempfile.mkstemp(dir = path.parent, prefix = f'{path.name}.', suffix = '.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # widening mkstemp's owner-only mode, so other users can read the written file
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_config_cache(config: dict, mtimes: tuple) -> None:
+    """
+    Writes the merged config to the on-disk cache.
+    """
+    
+    import pickle
+    
+    try:
+        write_atomically(
+            CONFIG_CACHE_PATH,
+            pickle.dumps((CONFIG_CACHE_VERSION, mtimes, config), protocol = pickle.HIGHEST_PROTOCOL)
+        )
+    # the cache is only an optimization, so failing to write it is not fatal
+    except OSError:
+        pass
+
+
+def _load_compiled_config(mtimes: tuple) -> dict | None:
+    """
+    Returns the config from the pre-compiled config module if it exists and was
+    compiled from YAML files with the given modification times, otherwise None.
     """
-    Loads the configuration settings from the YAML files in this folder, merging the
-    default and user settings in the process.
+    
+    # treating a missing or broken compiled module (e.g. a hand edit that no longer
+    # parses, or one without CONFIG) as a miss, so loading falls back to the cache or YAML
+    try:
+        from config import _compiled
+        
+        if _compiled.SOURCE_MTIMES != mtimes:
+            return None
+        
+        return _compiled.CONFIG
+    except Exception:
+        return None
+
+
+def _load_yaml_file(path: Path, loader: type) -> dict:
+    """
+    Parses a single YAML config file with the given loader class, treating an empty
+    file as an empty dictionary.
+    """
+    
+    import yaml
+    
+    # handing the loader raw bytes, so it detects and decodes UTF-8/UTF-16 itself
+    # (skipping a separate Python-level text decoding pass)
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader = loader) or dict()
+
+
+def parse_config() -> dict:
+    """
+    Parses the YAML files in this folder and merges the default and user settings,
+    bypassing every cache.
     
     Returns the merged dictionary.
     """
     
+    # preferring the libyaml-backed loader when PyYAML was built with it
+    # (falling back to the pure-Python loader otherwise; importing it only when actually
+    #  parsing, so importing this module or loading the config from a cache never pays for it)
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    
     # loading the default config (which must exist)
-    with open(DEFAULT_CONFIG_PATH, 'r', encoding = 'utf-8') as f:
-        default_config: dict = yaml.safe_load(f)
+    default_config = _load_yaml_file(DEFAULT_CONFIG_PATH, SafeLoader)
     
     # if present, loading the user config
     # (it should be present, but that issue can be handled when relevant;
     #  we don't need it to exist to resolve this functionality)
     if USER_CONFIG_PATH.exists():
-        with open(USER_CONFIG_PATH, 'r', encoding = 'utf-8') as f:
-            user_config: dict = yaml.safe_load(f) or dict()
+        user_config = _load_yaml_file(USER_CONFIG_PATH, SafeLoader)
     # if not present, we just initialize it to an empty dictionary
     else:
         user_config = dict()
     
     # returning the merged product of the two config dictionaries
+    # (strings are interned later, when load_config freezes the result)
     return _deep_merge_dicts(default_config, user_config)
 
 
-# loading the config settings once so the rest of the app can just import CONFIG
-CONFIG = load_config()
\ No newline at end of file
+def _load_merged_config() -> dict:
+    """
+    Returns the merged config from the compiled config module, the on-disk cache, or
+    (if neither matches the current YAML files) a fresh parse of the YAML files.
+    """
+    
+    mtimes = source_mtimes()
+    
+    # preferring the compiled config module if it was built from the current YAML files
+    compiled_config = _load_compiled_config(mtimes)
+    if compiled_config is not None:
+        return compiled_config
+    
+    # otherwise, reusing the cached config if it was built from the current YAML files
+    cached_config = _read_config_cache(mtimes)
+    if cached_config is not None:
+        return cached_config
+    
+    # parsing the YAML files and caching the product for later launches
+    config = parse_config()
+    _write_config_cache(config, mtimes)
+    
+    return config
+
+
+@functools.lru_cache(maxsize = None)
+def load_config() -> Mapping:
+    """
+    Loads the configuration settings from the YAML files in this folder, merging the
+    default and user settings in the process. If neither YAML file has changed since
+    they were last compiled or loaded, the merged settings are taken from the compiled
+    config module or the on-disk cache instead.
+    
+    The result is memoized, so repeated calls within a process only load once.
+    
+    Returns the merged settings as a read-only mapping, which is shared by everything
+    that uses the config (callers that need to modify part of it should copy it with
+    dict() first).
+    """
+    
+    return _freeze(_load_merged_config())
+
+
+def __getattr__(name: str):
+    """
+    Lazily resolves CONFIG on first access, so importing other names from this module
+    (e.g. the config paths) never touches the YAML files.
+    """
+    
+    # loading the config settings once so the rest of the app can just import CONFIG
+    if name == 'CONFIG':
+        globals()['CONFIG'] = load_config()
+        return globals()['CONFIG']
+    
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
\ No newline at end of file
@@ -14,6 +14,7 @@ All logic here is purely structural.
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Mapping
 
 from config.config import CONFIG
 from ui.theme import apply_theme
@@ -27,7 +28,9 @@ class YWARApp:
         """
         
         # creating the main Tkinter window
+        # (hidden while the layout is built, so geometry is only computed once)
         self.root = tk.Tk()
+        self.root.withdraw()
         
         # applying window metadata from config
         self._configure_window()
@@ -40,6 +43,10 @@ class YWARApp:
 
         # binding the keyboard shortcuts from config to individual functions
         self._bind_keys(CONFIG)
+        
+        # resolving the full layout in one geometry pass before showing the window
+        self.root.update_idletasks()
+        self.root.deiconify()
     
     def _configure_window(self) -> None:
         """
@@ -53,8 +60,11 @@ class YWARApp:
         window_config = CONFIG['window']
         
         # setting window title and initial width and height (formatted as geometry string)
-        self.root.title(f'{app_config['title']} v{app_config['version']}')
-        self.root.geometry(f'{window_config['width']}x{window_config['height']}')
+        # (binding the values first, since nested same-quote f-strings need Python 3.12+)
+        title, version = app_config['title'], app_config['version']
+        width, height = window_config['width'], window_config['height']
+        self.root.title(f'{title} v{version}')
+        self.root.geometry(f'{width}x{height}')
         
         # setting minimum window size
         self.root.minsize(window_config['min_width'], window_config['min_height'])
@@ -68,7 +78,7 @@ class YWARApp:
         if window_config.get('fullscreen', False):
             self.root.attributes('-fullscreen', True)
     
-    def _build_layout(self, config: dict) -> None:
+    def _build_layout(self, config: Mapping) -> None:
         """
         Builds the top-level layout. Uses a horizontal PanedWindow so the left and
         right sections can be resized by the user.
@@ -104,7 +114,9 @@ class YWARApp:
         - The task list (with current task highlighted)
         """
         
-        parent.pack(fill = tk.BOTH, expand = True)
+        # keeping the child packs below from propagating size requests up to the pane
+        # (the PanedWindow sizes the panel by weight anyway)
+        parent.pack_propagate(False)
         
         # adding placeholder content
         # TODO: review after further functionality implementation
@@ -121,7 +133,7 @@ class YWARApp:
         )
         task_placeholder.pack(anchor = 'w', padx = 12, pady = 6)
     
-    def _build_right_panel(self, parent: ttk.Frame, config: dict) -> None:
+    def _build_right_panel(self, parent: ttk.Frame, config: Mapping) -> None:
         """
         Builds the right-hand column, which is intended to display:
         - Timer and active timing information (top)
@@ -129,7 +141,9 @@ class YWARApp:
         - Task notes (bottom)
         """
         
-        parent.pack(fill = tk.BOTH, expand = True)
+        # keeping the child packs below from propagating size requests up to the pane
+        # (the PanedWindow sizes the panel by weight anyway)
+        parent.pack_propagate(False)
         
         # adding placeholder content for all three sub-panels
         # TODO: review after further functionality implementation
@@ -169,47 +183,46 @@ class YWARApp:
         self.footer_frame = ttk.Frame(self.root)
         self.footer_frame.pack(fill = tk.X, side = tk.BOTTOM, pady = 6)
         
-        # creating the complete task button
-        self.complete_button = ttk.Button(
-            self.footer_frame,
-            text = f'Complete Task ({CONFIG['controls']['complete_task_1'].lower().capitalize()}/' + \
-                    f'{CONFIG['controls']['complete_task_2'].lower().capitalize()})',
-            command = self._on_complete_task
-        )
-        self.complete_button.pack(side = tk.LEFT, padx = 6)
-        
-        # skip task button
-        self.skip_button = ttk.Button(
-            self.footer_frame,
-            text = f'Skip Task ({CONFIG['controls']['skip_task'].lower().capitalize()})',
-            command = self._on_skip_task
+        # creating the complete, skip, and undo task buttons from one table of
+        # (button attribute, label template, control keys, callback)
+        # (capitalize already lowercases the rest of the key name)
+        controls = CONFIG['controls']
+        buttons = (
+            (
+                'complete_button', 'Complete Task ({}/{})',
+                ('complete_task_1', 'complete_task_2'), self._on_complete_task
+            ),
+            ('skip_button', 'Skip Task ({})', ('skip_task',), self._on_skip_task),
+            ('undo_button', 'Undo Task ({})', ('undo_task',), self._on_undo_task)
         )
-        self.skip_button.pack(side = tk.LEFT, padx = 6)
         
-        # undo task button
-        self.undo_button = ttk.Button(
-            self.footer_frame,
-            text = f'Undo Task ({CONFIG['controls']['undo_task'].lower().capitalize()})',
-            command = self._on_undo_task
-        )
-        self.undo_button.pack(side = tk.LEFT, padx = 6)
+        for attribute_name, text_template, keys, command in buttons:
+            button = ttk.Button(
+                self.footer_frame,
+                text = text_template.format(*(controls[key].capitalize() for key in keys)),
+                command = command
+            )
+            button.pack(side = tk.LEFT, padx = 6)
+            setattr(self, attribute_name, button)
     
-    def _bind_keys(self, config: dict) -> None:
+    def _bind_keys(self, config: Mapping) -> None:
         """
         Binds keyboard shortcuts from config to app actions.
         """
         controls = config['controls']
+        complete_key_1, complete_key_2 = controls['complete_task_1'], controls['complete_task_2']
+        skip_key, undo_key = controls['skip_task'], controls['undo_task']
 
         # complete task shortcuts
-        self.root.bind(f'<{controls['complete_task_1']}>', self._on_complete_task)
-        self.root.bind(f'<{controls['complete_task_2']}>', self._on_complete_task)
+        self.root.bind(f'<{complete_key_1}>', self._on_complete_task)
+        self.root.bind(f'<{complete_key_2}>', self._on_complete_task)
         # TODO: resolve space behavior when a button is selected at the same time as it is pressed
 
         # skip task shortcuts
-        self.root.bind(f'<{controls['skip_task']}>', self._on_skip_task)
+        self.root.bind(f'<{skip_key}>', self._on_skip_task)
 
         # undo task shortcuts
-        self.root.bind(f'<{controls['undo_task']}>', self._on_undo_task)
+        self.root.bind(f'<{undo_key}>', self._on_undo_task)
     
     # --- placeholder callback methods ---
     # TODO: define once further functionality exists
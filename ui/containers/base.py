@@ -34,7 +34,7 @@ class YWARContainer(ttk.Frame):
     # placeholder virtual container attributes redefined by subclasses
     CONTAINER_TYPE: ContainerType = ContainerType.BASE
     BASE_COLOR: str = "#000000"
-    DEPTH_STYLES: dict = {}                             # depth to style mapping
+    DEPTH_STYLES: tuple = ()                            # styles indexed by depth
 
     def __init__(self, parent: tk.Frame, *, title = "", **kwargs):
         # initializing the parent frame itself
@@ -46,10 +46,29 @@ class YWARContainer(ttk.Frame):
         self.children_containers = []
 
         # computing nesting depth relative to containers of the same type
-        self.depth = self._compute_relative_depth()
+        # (reusing the parent's already computed depth instead of walking up the tree)
+        if (
+            self.parent_container is not None
+            and self.parent_container.CONTAINER_TYPE == self.CONTAINER_TYPE
+        ):
+            self.depth = self.parent_container.depth + 1
+        else:
+            self.depth = 0
 
         # resolving styling based on depth
         self.style_tokens = self._resolve_style_tokens()
 
         # building visual structure
-        self._build_structure()
\ No newline at end of file
+        self._build_structure()
+
+    def _resolve_style_tokens(self) -> dict:
+        """
+        Resolves the style tokens for this container's depth. Containers nested deeper
+        than the styles defined reuse the deepest defined style.
+        """
+
+        depth_styles = self.DEPTH_STYLES
+        if not depth_styles:
+            return {}
+
+        return depth_styles[min(self.depth, len(depth_styles) - 1)]
\ No newline at end of file
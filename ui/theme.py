@@ -10,92 +10,84 @@ Responsibilities:
 This file translates config values into concrete Tkinter styling.
 """
 
-import tkinter as tk
-from tkinter import ttk
+import operator
+from typing import TYPE_CHECKING, Mapping
 
+# importing tkinter only for type checking, so importing this module doesn't load Tk
+# (ttk is imported inside apply_theme, where it is actually used)
+if TYPE_CHECKING:
+    import tkinter as tk
 
-def _get_colors_from_theme(config: dict) -> dict:
+
+# extracting every palette entry from a theme in a single call
+_GET_THEME_COLORS = operator.itemgetter(
+    'background', 'foreground', 'panel_bg', 'accent', 'highlight', 'border'
+)
+
+
+def _get_colors_from_theme(config: Mapping) -> dict:
     # resolving the theme from the UI settings (if absent, defaulting to light theme)
     theme_name = config['ui'].get('theme', 'light')
     
     # obtaining color palettes for the given theme from theme config info
     theme_config = config['themes'][theme_name]
+    bg, fg, panel_bg, accent, highlight, border = _GET_THEME_COLORS(theme_config)
     return {
-        'bg': theme_config['background'],
-        'fg': theme_config['foreground'],
-        'panel_bg': theme_config['panel_bg'],
-        'accent': theme_config['accent'],
-        'highlight': theme_config['highlight'],
-        'border': theme_config['border']
+        'bg': bg,
+        'fg': fg,
+        'panel_bg': panel_bg,
+        'accent': accent,
+        'highlight': highlight,
+        'border': border
     }
 
 
-def _configure_frame_style(style: ttk.Style, panel_bg: str) -> None:
-    style.configure(
-        'TFrame',
-        background = panel_bg
-    )
-
-def _configure_label_style(style: ttk.Style, panel_bg: str, fg: str, font_family: str, font_size: int) -> None:
-    style.configure(
-        'TLabel',
-        background = panel_bg,
-        foreground = fg,
-        font = (
-            font_family,
-            font_size
-        )
-    )
-
-def _configure_button_style(style: ttk.Style, font_family: str, font_size: int, padding: int) -> None:
-    style.configure(
-        'TButton',
-        font = (
-            font_family,
-            font_size
-        ),
-        padding = padding
-    )
-
-def _configure_header_style(style: ttk.Style, font_family: str, header_font_size: int) -> None:
-    style.configure(
-        'Header.TLabel',
-        font = (
-            font_family,
-            header_font_size,
-        )
-    )
+def _resolve_fonts(font_config: Mapping) -> dict:
+    """
+    Returns the font tuples used by the ttk styles, keyed by their role.
+    """
+    
+    font_family = font_config['family']
+    font_size = font_config['size']
+    
+    return {
+        'base': (font_family, font_size),
+        'header': (font_family, font_config['header_size']),
+        'highlight': (font_family, font_size, 'bold'),
+        'timer': (font_config['monospace_family'], font_config['timer_size'], 'bold')
+    }
 
-def _configure_highlight_style(style: ttk.Style, highlight: str, font_family: str, font_size: int) -> None:
-    style.configure(
-        'Highlight.TLabel',
-        foreground = highlight,
-        font = (
-            font_family,
-            font_size,
-            'bold'
-        )
-    )
 
-def _configure_timer_style(style: ttk.Style, monospace_font_family: str, timer_font_size: int) -> None:
-    style.configure(
-        'Timer.TLabel',
-        font = (
-            monospace_font_family,
-            timer_font_size,
-            'bold'
-        )
+def _build_style_table(colors: dict, fonts: dict) -> tuple:
+    """
+    Returns the (style name, options) pairs applied to the ttk style system.
+    """
+    
+    panel_bg = colors['panel_bg']
+    base_font = fonts['base']
+    
+    return (
+        # generic frame style
+        ('TFrame', {'background': panel_bg}),
+        # labels, buttons, etc.
+        ('TLabel', {'background': panel_bg, 'foreground': colors['fg'], 'font': base_font}),
+        ('TButton', {'font': base_font, 'padding': 6}),
+        ('Header.TLabel', {'font': fonts['header']}),
+        ('Highlight.TLabel', {'foreground': colors['highlight'], 'font': fonts['highlight']}),
+        ('Timer.TLabel', {'font': fonts['timer']})
     )
 
 
-def apply_theme(root: tk.Tk, config: dict) -> dict:
+def apply_theme(root: 'tk.Tk', config: Mapping) -> dict:
     """
     Applies theme settings to the Tk root window and ttk styles.
     
-    Returns a dictionary of resolved colors/fonts that the rest of the UI
-    can reference when creating widgets.
+    Returns a dictionary of resolved colors that the rest of the UI can reference
+    when creating widgets.
     """
     
+    from tkinter import ttk
+    
     # getting colors dictionary from theme info in config
     colors = _get_colors_from_theme(config)
     
@@ -108,32 +100,11 @@ def apply_theme(root: tk.Tk, config: dict) -> dict:
     # using the platform-native theme as a base
     style.theme_use(style.theme_use())
     
-    # configuring a generic frame style
-    panel_bg = colors['panel_bg']
-    _configure_frame_style(style, panel_bg = panel_bg)
-    
-    # configuring labels, buttons, etc.
-    font_family = config['ui']['font']['family']
-    font_size = config['ui']['font']['size']
+    # resolving the font tuples once, so styles sharing a font share the same tuple
+    fonts = _resolve_fonts(config['ui']['font'])
     
-    _configure_label_style(
-        style, panel_bg = panel_bg, fg = colors['fg'],
-        font_family = font_family, font_size = font_size
-    )
-    _configure_button_style(
-        style, font_family = font_family, font_size = font_size, padding = 6
-    )
-    _configure_header_style(
-        style, font_family = font_family,
-        header_font_size = config['ui']['font']['header_size']
-    )
-    _configure_highlight_style(
-        style, highlight = colors['highlight'], font_family = font_family,
-        font_size = font_size
-    )
-    _configure_timer_style(
-        style, monospace_font_family = config['ui']['font']['monospace_family'],
-        timer_font_size = config['ui']['font']['timer_size']
-    )
+    # configuring frames, labels, buttons, etc.
+    for style_name, options in _build_style_table(colors, fonts):
+        style.configure(style_name, **options)
     
     return colors
\ No newline at end of file